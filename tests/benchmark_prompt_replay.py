@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Prompt-Corpus Replay for user-prompt-submit.py hook
+
+Replays a prompt corpus through the real hook in two ways:
+1. In process: hook.analyze_request(prompt, skill_rules), cold (first call
+   on a freshly loaded hook module, sampled) and warm (full corpus passes)
+2. Full hook as a subprocess, exactly as Claude Code runs it (stdin JSON)
+
+Corpus = synthetic prompts (keywords/patterns from every skill, negations,
+compounds, long pasted logs) + optional redacted session prompts.
+
+Reports p50/p95/p99/max latency and throughput, and compares against a
+machine-readable baseline with a tolerance (exit 1 on regression).
+
+Usage:
+    python3 tests/benchmark_prompt_replay.py                    # Run + compare
+    python3 tests/benchmark_prompt_replay.py --write-baseline   # Record baseline
+    python3 tests/benchmark_prompt_replay.py --corpus prompts.jsonl --tolerance 0.5
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import math
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+HOOK_PATH = project_root / '.claude' / 'hooks' / 'user-prompt-submit.py'
+SKILL_RULES_PATH = project_root / '.claude' / 'skills' / 'skill-rules.json'
+BASELINE_PATH = project_root / 'tests' / 'prompt_replay_baseline.json'
+
+# Relative slowdown allowed vs. baseline before a metric counts as regressed
+DEFAULT_TOLERANCE = 0.25
+
+# Absolute slowdown ignored regardless of tolerance: in-process latencies are
+# a few microseconds, where timer jitter alone exceeds any relative tolerance
+DEFAULT_MIN_DELTA_MS = 0.5
+
+# Metrics compared against the baseline (lower is better)
+COMPARED_METRICS = ['p50_ms', 'p95_ms', 'p99_ms']
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+RESEARCH_TEMPLATES = [
+    "research {topic}",
+    "Please research {topic} in modern web apps",
+    "investigate {topic} and summarize the tradeoffs",
+    "analyze {topic} across the major vendors",
+    "Can you study {topic} patterns used in production?",
+]
+
+PLANNING_TEMPLATES = [
+    "build a {thing}",
+    "Design an architecture for a {thing}",
+    "plan the implementation of a {thing}",
+    "create a {thing} with tests",
+    "implement a {thing} feature for users",
+]
+
+SEARCH_TEMPLATES = [
+    "find the {topic} logic",
+    "where is {topic} handled?",
+    "search for {topic} examples in the code",
+]
+
+COMPOUND_TEMPLATES = [
+    "research {topic} then build a {thing}",
+    "first investigate {topic}, then design a {thing}",
+    "Research {topic} and then create a {thing} based on findings",
+]
+
+NEGATED_TEMPLATES = [
+    "don't research {topic}, just build a {thing}",
+    "skip the research and implement a {thing}",
+]
+
+NEUTRAL_PROMPTS = [
+    "continue",
+    "run the tests again",
+    "yes",
+    "looks good, commit it",
+    "What does this error mean?",
+    "The researcher built an authentication system",
+    "",
+]
+
+TOPICS = [
+    "OAuth2 authentication", "caching strategies", "vector databases",
+    "rate limiting", "error handling", "database migrations",
+    "load balancing", "quantum computing", "websocket scaling",
+]
+
+THINGS = [
+    "task tracker app", "monitoring dashboard", "REST API", "CLI tool",
+    "notification service", "search and analysis tool",
+]
+
+PASTED_LOG_LINE = '  File "/srv/app/{name}.py", line {line}, in {func}\n    raise ValueError("{topic}")\n'
+
+
+def _pasted_log(rng: random.Random, lines: int) -> str:
+    """Stack-trace-like paste, the shape of large real prompts"""
+    return ''.join(
+        PASTED_LOG_LINE.format(
+            name=rng.choice(['worker', 'research', 'build', 'api']),
+            line=rng.randint(1, 999),
+            func=rng.choice(['run', 'search', 'create', 'handle']),
+            topic=rng.choice(TOPICS),
+        )
+        for _ in range(lines)
+    )
+
+
+def build_synthetic_corpus(size: int = 1000, seed: int = 42) -> list:
+    """Deterministic synthetic prompts covering every hook code path"""
+    rng = random.Random(seed)
+    template_groups = [
+        RESEARCH_TEMPLATES, PLANNING_TEMPLATES, SEARCH_TEMPLATES,
+        COMPOUND_TEMPLATES, NEGATED_TEMPLATES,
+    ]
+    corpus = []
+
+    for i in range(size):
+        kind = i % 10
+        if kind < 6:
+            template = rng.choice(template_groups[kind % len(template_groups)])
+            prompt = template.format(topic=rng.choice(TOPICS), thing=rng.choice(THINGS))
+        elif kind < 8:
+            prompt = rng.choice(NEUTRAL_PROMPTS)
+        else:
+            # Pasted log with the actual request before or after it
+            request = rng.choice(RESEARCH_TEMPLATES + PLANNING_TEMPLATES).format(
+                topic=rng.choice(TOPICS), thing=rng.choice(THINGS)
+            )
+            log = _pasted_log(rng, rng.choice([20, 200, 2000]))
+            prompt = f"{request}\n{log}" if kind == 8 else f"{log}\n{request}"
+        corpus.append(prompt)
+
+    return corpus
+
+
+REDACTIONS = [
+    (re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+'), '<email>'),
+    (re.compile(r'(/Users|/home)/[^/\s]+'), r'\1/<user>'),
+    (re.compile(r'\b(sk|ghp|gho|xox[abp])[-_][A-Za-z0-9_-]{10,}'), '<token>'),
+    (re.compile(r'\b[0-9a-fA-F]{32,}\b'), '<hex>'),
+]
+
+
+def redact(prompt: str) -> str:
+    """Strip emails, home directories, API tokens and long hex ids"""
+    for pattern, replacement in REDACTIONS:
+        prompt = pattern.sub(replacement, prompt)
+    return prompt
+
+
+def load_corpus_file(path: Path) -> list:
+    """
+    Load session prompts: JSONL with a "prompt" (or "user_prompt") field per
+    line, or plain text with one prompt per line. Prompts are redacted;
+    records without a non-empty string prompt are skipped.
+    """
+    prompts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                prompt = line
+            else:
+                if isinstance(record, dict):
+                    prompt = record.get('prompt') or record.get('user_prompt')
+                else:
+                    prompt = line
+            if not isinstance(prompt, str) or not prompt:
+                continue  # null / missing / non-string prompt field
+            prompts.append(redact(prompt))
+    return prompts
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(latencies_ms: list, elapsed_s: float) -> dict:
+    """Latency distribution + throughput for one measurement"""
+    return {
+        'count': len(latencies_ms),
+        'mean_ms': statistics.mean(latencies_ms),
+        'p50_ms': percentile(latencies_ms, 50),
+        'p95_ms': percentile(latencies_ms, 95),
+        'p99_ms': percentile(latencies_ms, 99),
+        'max_ms': max(latencies_ms),
+        'throughput_per_s': len(latencies_ms) / elapsed_s if elapsed_s else 0.0,
+    }
+
+
+def load_hook():
+    """Import the hook module (hyphenated filename) like the unit tests do"""
+    spec = importlib.util.spec_from_file_location("user_prompt_submit", HOOK_PATH)
+    hook = importlib.util.module_from_spec(spec)
+    sys.modules["user_prompt_submit"] = hook
+    spec.loader.exec_module(hook)
+    return hook
+
+
+def replay_pass(hook, corpus: list, skill_rules: dict) -> dict:
+    """One pass of analyze_request over the corpus"""
+    latencies = []
+    pass_start = time.perf_counter()
+    for prompt in corpus:
+        start = time.perf_counter()
+        hook.analyze_request(prompt, skill_rules)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return summarize(latencies, time.perf_counter() - pass_start)
+
+
+def benchmark_cold_calls(corpus: list, skill_rules: dict, samples: int = 50, seed: int = 42) -> dict:
+    """
+    First-call latency: for each sampled prompt, load a fresh hook module and
+    purge the re module cache, then time a single analyze_request call.
+    """
+    sample = random.Random(seed).sample(corpus, min(samples, len(corpus)))
+    latencies = []
+
+    for prompt in sample:
+        hook = load_hook()
+        re.purge()
+        start = time.perf_counter()
+        hook.analyze_request(prompt, skill_rules)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return summarize(latencies, sum(latencies) / 1000)
+
+
+def benchmark_in_process(corpus: list, skill_rules: dict, warm_passes: int = 3,
+                         cold_samples: int = 50, seed: int = 42) -> dict:
+    """Cold = sampled first calls on fresh modules, warm = best full-corpus pass"""
+    cold = benchmark_cold_calls(corpus, skill_rules, cold_samples, seed)
+
+    hook = load_hook()
+    replay_pass(hook, corpus, skill_rules)  # Warm-up pass, not reported
+
+    warm = None
+    for _ in range(warm_passes):
+        result = replay_pass(hook, corpus, skill_rules)
+        if warm is None or result['p50_ms'] < warm['p50_ms']:
+            warm = result
+
+    return {'cold': cold, 'warm': warm}
+
+
+def run_hook_subprocess(prompt: str) -> float:
+    """Run the full hook once; returns wall-clock ms"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(HOOK_PATH)],
+        input=json.dumps({"user_prompt": prompt}),
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"Hook exited {proc.returncode}: {proc.stderr.strip()[-500:]}")
+    return elapsed
+
+
+def benchmark_subprocess(corpus: list, samples: int = 50, seed: int = 42) -> dict:
+    """
+    Every run is a fresh interpreter. Cold = the very first run (OS caches
+    not yet warm for the hook's files), warm = the remaining runs.
+    """
+    sample = random.Random(seed).sample(corpus, min(samples, len(corpus)))
+
+    cold_ms = run_hook_subprocess(sample[0])
+
+    latencies = []
+    start = time.perf_counter()
+    for prompt in sample[1:] or sample:
+        latencies.append(run_hook_subprocess(prompt))
+    warm = summarize(latencies, time.perf_counter() - start)
+
+    return {'cold_first_run_ms': cold_ms, 'warm': warm}
+
+
+# =============================================================================
+# BASELINE
+# =============================================================================
+
+def corpus_identity(synthetic: int, seed: int, corpus: list, corpus_files: list) -> dict:
+    """Identifies the corpus a run measured, so baselines are only compared like for like"""
+    digest = hashlib.sha256()
+    for prompt in corpus:
+        digest.update(prompt.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return {
+        'synthetic': synthetic,
+        'seed': seed,
+        'files': [Path(path).name for path in corpus_files],
+        'size': len(corpus),
+        'sha256': digest.hexdigest(),
+    }
+
+
+def flatten_metrics(results: dict) -> dict:
+    """{'in_process.warm.p95_ms': 0.12, ...} for the compared metrics"""
+    flat = {}
+    for mode in ('in_process', 'subprocess'):
+        for phase, stats in results.get(mode, {}).items():
+            if not isinstance(stats, dict):
+                continue
+            for metric in COMPARED_METRICS:
+                if metric in stats:
+                    flat[f"{mode}.{phase}.{metric}"] = stats[metric]
+    return flat
+
+
+def uncompared_metrics(results: dict, baseline: dict) -> list:
+    """Baseline metrics the current run did not measure (e.g. --subprocess-samples 0)"""
+    current = flatten_metrics(results)
+    return sorted(metric for metric in flatten_metrics(baseline) if metric not in current)
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float,
+                        min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list:
+    """
+    Return list of (metric, baseline_ms, current_ms) that regressed: slower
+    than baseline by more than `tolerance` AND by more than `min_delta_ms`.
+    """
+    current = flatten_metrics(results)
+    previous = flatten_metrics(baseline)
+    regressions = []
+
+    for metric, baseline_ms in previous.items():
+        current_ms = current.get(metric)
+        if current_ms is None:
+            continue  # Reported by uncompared_metrics()
+        if current_ms - baseline_ms <= min_delta_ms:
+            continue
+        if current_ms > baseline_ms * (1 + tolerance):
+            regressions.append((metric, baseline_ms, current_ms))
+
+    return regressions
+
+
+def print_stats(label: str, stats: dict):
+    print(f"  {label:<22} p50={stats['p50_ms']:8.3f}ms  p95={stats['p95_ms']:8.3f}ms  "
+          f"p99={stats['p99_ms']:8.3f}ms  max={stats['max_ms']:8.3f}ms  "
+          f"{stats['throughput_per_s']:10.1f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a prompt corpus through user-prompt-submit.py")
+    parser.add_argument('--synthetic', type=int, default=1000, help="Synthetic prompts (default: 1000)")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic corpus seed (default: 42)")
+    parser.add_argument('--corpus', type=Path, action='append', default=[],
+                        help="Extra prompts (JSONL or one per line), redacted on load; repeatable")
+    parser.add_argument('--cold-samples', type=int, default=50,
+                        help="Prompts timed as first call on a fresh hook module (default: 50)")
+    parser.add_argument('--subprocess-samples', type=int, default=50,
+                        help="Prompts replayed through the full hook (default: 50, 0 to skip)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument('--write-baseline', action='store_true', help="Record results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed relative slowdown (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help=f"Absolute slowdown always ignored (default: {DEFAULT_MIN_DELTA_MS}ms)")
+    args = parser.parse_args()
+
+    corpus = build_synthetic_corpus(args.synthetic, seed=args.seed)
+    for path in args.corpus:
+        corpus.extend(load_corpus_file(path))
+
+    if not corpus:
+        print("✗ ERROR: corpus is empty (use --synthetic N and/or --corpus FILE)")
+        return 2
+
+    with open(SKILL_RULES_PATH, 'r') as f:
+        skill_rules = json.load(f)
+
+    print("Prompt-Corpus Replay Benchmark")
+    print("=" * 60)
+    print(f"Corpus: {len(corpus)} prompts ({args.synthetic} synthetic, "
+          f"{len(corpus) - args.synthetic} from {len(args.corpus)} file(s))")
+    print(f"Largest prompt: {max(len(p) for p in corpus) // 1024}KB")
+    print()
+
+    results = {
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'corpus': corpus_identity(args.synthetic, args.seed, corpus, args.corpus),
+        'samples': {'cold': args.cold_samples, 'subprocess': args.subprocess_samples},
+        'in_process': benchmark_in_process(corpus, skill_rules, cold_samples=args.cold_samples,
+                                           seed=args.seed),
+    }
+
+    print("In process (hook.analyze_request):")
+    print_stats("cold (first call)", results['in_process']['cold'])
+    print_stats("warm (best pass)", results['in_process']['warm'])
+
+    if args.subprocess_samples > 0:
+        results['subprocess'] = benchmark_subprocess(corpus, args.subprocess_samples, seed=args.seed)
+        print("\nFull hook (subprocess):")
+        print(f"  {'cold (first run)':<22} {results['subprocess']['cold_first_run_ms']:8.1f}ms")
+        print_stats("warm", results['subprocess']['warm'])
+
+    print()
+    print("=" * 60)
+
+    if args.write_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline} (run with --write-baseline)")
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+
+    if baseline.get('corpus') != results['corpus'] or baseline.get('samples') != results['samples']:
+        print("✗ ERROR: baseline was recorded on a different corpus or sample size; refusing to compare")
+        for key in ('corpus', 'samples'):
+            print(f"  baseline {key}: {json.dumps(baseline.get(key))}")
+            print(f"  current {key}:  {json.dumps(results[key])}")
+        print("  Re-run with the baseline's corpus and sample options or record a new baseline (--write-baseline)")
+        return 2
+
+    missing = uncompared_metrics(results, baseline)
+    if missing:
+        print("✗ ERROR: baseline metrics not measured by this run; refusing to compare")
+        for metric in missing:
+            print(f"  {metric}")
+        print("  Re-run with the baseline's measurement options or record a new baseline (--write-baseline)")
+        return 2
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_delta_ms)
+    if not regressions:
+        print(f"✓ PASS: within {args.tolerance:.0%} (or {args.min_delta_ms}ms) of baseline "
+              f"({baseline.get('timestamp', 'unknown')})")
+        return 0
+
+    print(f"✗ FAIL: {len(regressions)} metric(s) regressed more than {args.tolerance:.0%} "
+          f"and {args.min_delta_ms}ms:")
+    for metric, baseline_ms, current_ms in regressions:
+        print(f"  {metric:<32} {baseline_ms:8.3f}ms -> {current_ms:8.3f}ms "
+              f"(+{(current_ms / baseline_ms - 1):.0%})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,6 +9,11 @@ Measures:
 - Time for runtime compilation approach (re.search(pattern_string, ...))
 - Time for pre-compiled approach (compiled_pattern.search(...))
 - Performance improvement percentage
+
+Also benchmarks adversarial prompts (1MB pasted logs / stack traces) scanned
+in full vs. through a bounded scan window, so that the cost of the hook's
+patterns stays independent of prompt size. For prompts whose request sits at
+the head or tail, per-pattern hits must be identical in both modes.
 """
 
 import time
@@ -59,6 +64,92 @@ SAMPLE_PATTERNS_COMPILED = [
 ]
 
 
+# Bounded scan window: user intent sits at the start or the end of a prompt,
+# pasted logs in the middle. Head + tail keeps matching cost constant.
+SCAN_WINDOW_HEAD = 4096
+SCAN_WINDOW_TAIL = 1024
+
+ADVERSARIAL_PROMPT_BYTES = 1024 * 1024
+
+# Real request around a pasted log; triggers both compound patterns
+# ("research ... then ... build" and "first research ... then")
+EDGE_REQUEST = "First research OAuth2 token refresh flows then design and build a login service"
+
+# Neutral filler: no skill keywords, so any hit comes from EDGE_REQUEST
+PASTED_LOG_UNIT = '  File "/srv/app/worker.py", line 12, in handle_event\n    raise ValueError(value)\n'
+
+# Adversarial prompts whose request sits inside the scan window (head or
+# tail): windowed scanning must find exactly the same pattern hits
+EDGE_INTENT_PROMPTS = ['pasted_log_request_first', 'pasted_log_request_last']
+
+
+def build_adversarial_prompts(size=ADVERSARIAL_PROMPT_BYTES):
+    """
+    Build ~1MB prompts that maximise work for the hook patterns.
+
+    Each one repeats a pattern prefix that never completes, so every
+    position is a candidate start and the bounded gaps (.{3,30}, .{3,60})
+    are fully explored before failing.
+    """
+    def fill(unit):
+        return (unit * (size // len(unit) + 1))[:size]
+
+    return {
+        'research_without_then': fill("research " + "x" * 25 + " "),
+        'first_research_no_then': fill("first research " + "y" * 50),
+        'study_no_pattern_word': fill("study " + "z" * 28 + " "),
+        'whitespace_only': fill(" "),
+        'pasted_log_request_first': EDGE_REQUEST + "\n" + fill(PASTED_LOG_UNIT),
+        'pasted_log_request_last': fill(PASTED_LOG_UNIT) + "\n" + EDGE_REQUEST,
+    }
+
+
+def bounded_scan_window(prompt, head=SCAN_WINDOW_HEAD, tail=SCAN_WINDOW_TAIL):
+    """Return the part of the prompt that is scanned in bounded mode"""
+    if len(prompt) <= head + tail:
+        return prompt
+    return prompt[:head] + "\n" + prompt[-tail:]
+
+
+def benchmark_adversarial(prompts, patterns_compiled, windowed, runs=3):
+    """
+    Time one search of every pattern per prompt.
+
+    Returns {name: {'ms': best_ms, 'hits': [bool per pattern]}}
+    """
+    results = {}
+
+    for name, prompt in prompts.items():
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            text = bounded_scan_window(prompt) if windowed else prompt
+            hits = [pattern.search(text) is not None for pattern in patterns_compiled]
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = {'ms': best, 'hits': hits}
+
+    return results
+
+
+def check_window_detection(full, windowed, names=EDGE_INTENT_PROMPTS, patterns_str=SAMPLE_PATTERNS_STR):
+    """
+    Assert the bounded window finds the same per-pattern hits as a full scan
+    for prompts whose request is at the head or tail, and that the request
+    actually triggered the compound pattern (otherwise equality is vacuous).
+    """
+    compound = patterns_str.index(r"research\s+.{3,30}\s+then\s+.{3,30}\s+(build|create)")
+
+    for name in names:
+        assert full[name]['hits'][compound], f"{name}: compound pattern not triggered by full scan"
+        mismatched = [
+            patterns_str[i]
+            for i, (f, w) in enumerate(zip(full[name]['hits'], windowed[name]['hits']))
+            if f != w
+        ]
+        assert not mismatched, f"{name}: window scan missed/added hits for {mismatched}"
+
+
 def benchmark_runtime_compilation(prompts, patterns_str, iterations=100):
     """Benchmark with runtime regex compilation (OLD approach)"""
     start = time.perf_counter()
@@ -168,6 +259,53 @@ def run_benchmark(iterations=100, runs=5):
     }
 
 
+def run_adversarial_benchmark(runs=3):
+    """Compare full-text vs. bounded-window scanning on 1MB adversarial prompts"""
+    prompts = build_adversarial_prompts()
+
+    print(f"Adversarial Prompt Benchmark (full scan vs. bounded window)")
+    print(f"=" * 60)
+    print(f"Prompt size: {ADVERSARIAL_PROMPT_BYTES // 1024}KB")
+    print(f"Regex patterns: {len(SAMPLE_PATTERNS_COMPILED)}")
+    print(f"Scan window: {SCAN_WINDOW_HEAD}B head + {SCAN_WINDOW_TAIL}B tail")
+    print()
+
+    full = benchmark_adversarial(prompts, SAMPLE_PATTERNS_COMPILED, windowed=False, runs=runs)
+    windowed = benchmark_adversarial(prompts, SAMPLE_PATTERNS_COMPILED, windowed=True, runs=runs)
+
+    print(f"{'Prompt':<28} {'Full (ms)':>12} {'Window (ms)':>12} {'Speedup':>10} {'Hits':>8}")
+    print("-" * 74)
+    for name in prompts:
+        full_ms = full[name]['ms']
+        windowed_ms = windowed[name]['ms']
+        speedup = full_ms / windowed_ms if windowed_ms else float('inf')
+        hits = f"{sum(windowed[name]['hits'])}/{sum(full[name]['hits'])}"
+        print(f"{name:<28} {full_ms:>12.2f} {windowed_ms:>12.3f} {speedup:>9.0f}x {hits:>8}")
+
+    check_window_detection(full, windowed)
+    print()
+    print(f"Detection preserved (window hits == full hits): {', '.join(EDGE_INTENT_PROMPTS)}")
+
+    worst_full = max(r['ms'] for r in full.values())
+    worst_windowed = max(r['ms'] for r in windowed.values())
+    print()
+    print(f"Worst case full scan:   {worst_full:.2f}ms")
+    print(f"Worst case window scan: {worst_windowed:.3f}ms")
+    print(f"Within 100ms hook budget: full={'YES' if worst_full < 100 else 'NO'}, "
+          f"window={'YES' if worst_windowed < 100 else 'NO'}")
+    print()
+    print("=" * 60)
+
+    return {
+        'full_ms': {name: r['ms'] for name, r in full.items()},
+        'windowed_ms': {name: r['ms'] for name, r in windowed.items()},
+        'full_hits': {name: r['hits'] for name, r in full.items()},
+        'windowed_hits': {name: r['hits'] for name, r in windowed.items()},
+        'worst_full_ms': worst_full,
+        'worst_windowed_ms': worst_windowed,
+    }
+
+
 if __name__ == '__main__':
     # Run benchmark with default settings
     results = run_benchmark(iterations=100, runs=5)
@@ -180,3 +318,9 @@ if __name__ == '__main__':
     print(f"- After (pre-compiled patterns): {results['precompiled_mean']:.2f}ms")
     print(f"- Improvement: {results['improvement_pct']:.1f}% faster ({results['speedup']:.2f}x speedup)")
     print(f"- Per-prompt savings: ~{(results['runtime_mean'] - results['precompiled_mean']) / 100:.3f}ms")
+
+    print()
+    adversarial = run_adversarial_benchmark()
+    print("\nAdversarial 1MB prompts (10 patterns, worst case):")
+    print(f"- Full scan: {adversarial['worst_full_ms']:.2f}ms")
+    print(f"- Bounded window: {adversarial['worst_windowed_ms']:.3f}ms")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Import-time measurement for user-prompt-submit.py hook
+EVIDENCE-BASED VALIDATION - Measure, don't assume
+
+Every prompt starts a fresh interpreter, so the hook's whole import graph is
+paid on each invocation. This script loads the hook in a cold interpreter
+under `python3 -X importtime`, aggregates the per-module self times by
+top-level package, and reports the wall-clock cost of loading the hook.
+
+-X importtime inflates the times it measures, so load time (the figure
+compared against budgets) comes from a separate uninstrumented cold load;
+the instrumented run is only used for the per-package breakdown.
+
+Interpreter startup imports (site, encodings, ...) are excluded: only imports
+triggered after the hook starts loading are counted.
+
+Usage:
+    python3 tests/measure_hook_import_time.py
+    python3 tests/measure_hook_import_time.py --runs 10 --top 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+HOOK_PATH = project_root / '.claude' / 'hooks' / 'user-prompt-submit.py'
+
+# Written to stderr right before the hook is loaded, so that the importtime
+# lines of interpreter startup can be told apart from the hook's own.
+START_MARKER = '### HOOK-IMPORT-START'
+
+# Loads the hook exactly like tests/test_user_prompt_submit.py does (module
+# body executes, main() does not) and prints the load time in ms on stdout.
+LOADER_SOURCE = f"""
+import sys, time, importlib.util
+sys.stderr.write({START_MARKER!r} + '\\n')
+sys.stderr.flush()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('user_prompt_submit', sys.argv[1])
+hook = importlib.util.module_from_spec(spec)
+sys.modules['user_prompt_submit'] = hook
+spec.loader.exec_module(hook)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    Parse `-X importtime` output that follows START_MARKER.
+
+    Returns list of dicts: {'module', 'self_us', 'cumulative_us', 'depth'}
+    """
+    records = []
+    started = False
+
+    for line in stderr.splitlines():
+        if line.strip() == START_MARKER:
+            started = True
+            continue
+        if not started or not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            continue  # Header line ("self [us] | cumulative | imported package")
+
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        records.append({
+            'module': stripped,
+            'self_us': self_us,
+            'cumulative_us': cumulative_us,
+            'depth': (len(name) - len(stripped) - 1) // 2,
+        })
+
+    return records
+
+
+def aggregate_by_package(records: list) -> dict:
+    """Sum self times (us) per top-level package, sorted most expensive first."""
+    totals = {}
+    for record in records:
+        package = record['module'].split('.')[0]
+        totals[package] = totals.get(package, 0) + record['self_us']
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _run_loader(hook_path: Path, python: str, instrumented: bool) -> subprocess.CompletedProcess:
+    """Run LOADER_SOURCE in a fresh interpreter, optionally under -X importtime"""
+    hook_path = Path(hook_path)
+    if not hook_path.exists():
+        raise FileNotFoundError(f"Hook not found: {hook_path}")
+
+    flags = ['-X', 'importtime'] if instrumented else []
+    proc = subprocess.run(
+        [python, *flags, '-c', LOADER_SOURCE, str(hook_path)],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Hook failed to load: {proc.stderr.strip()[-500:]}")
+    return proc
+
+
+def measure_cold_load(hook_path: Path = HOOK_PATH, python: str = sys.executable) -> float:
+    """
+    Load the hook once in a fresh, uninstrumented interpreter.
+
+    Returns:
+        Load time in ms (the figure compared against budgets)
+
+    Raises:
+        FileNotFoundError: If hook_path does not exist
+        RuntimeError: If the hook fails to load
+    """
+    proc = _run_loader(hook_path, python, instrumented=False)
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def measure_cold_import(hook_path: Path = HOOK_PATH, python: str = sys.executable) -> dict:
+    """
+    Load the hook once in a fresh interpreter under -X importtime.
+
+    Returns:
+        {'load_ms': float, 'import_us': int, 'packages': {name: self_us}}
+        (load_ms includes importtime overhead; use measure_cold_load for budgets)
+
+    Raises:
+        FileNotFoundError: If hook_path does not exist
+        RuntimeError: If the hook fails to load
+    """
+    proc = _run_loader(hook_path, python, instrumented=True)
+
+    records = parse_importtime(proc.stderr)
+    return {
+        'load_ms': float(proc.stdout.strip().splitlines()[-1]),
+        'import_us': sum(r['self_us'] for r in records),
+        'packages': aggregate_by_package(records),
+    }
+
+
+def measure_hook_import_time(hook_path: Path = HOOK_PATH, runs: int = 5) -> dict:
+    """
+    Measure cold hook load `runs` times and aggregate.
+
+    Each run does one uninstrumented load (median/min/max load time; median
+    is the figure compared against budgets) and one -X importtime load
+    (package self times, averaged across runs).
+    """
+    load_times = []
+    samples = []
+    for _ in range(runs):
+        load_times.append(measure_cold_load(hook_path))
+        samples.append(measure_cold_import(hook_path))
+
+    packages = {}
+    for sample in samples:
+        for package, self_us in sample['packages'].items():
+            packages[package] = packages.get(package, 0) + self_us
+    packages = {
+        package: total / runs
+        for package, total in sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    }
+
+    return {
+        'runs': runs,
+        'median_load_ms': statistics.median(load_times),
+        'min_load_ms': min(load_times),
+        'max_load_ms': max(load_times),
+        'median_instrumented_load_ms': statistics.median(s['load_ms'] for s in samples),
+        'median_import_ms': statistics.median(s['import_us'] for s in samples) / 1000,
+        'packages_us': packages,
+    }
+
+
+def main():
+    """Print the aggregated import-time report and save it as JSON"""
+    parser = argparse.ArgumentParser(description="Measure user-prompt-submit.py cold import time")
+    parser.add_argument('--runs', type=int, default=5, help="Cold interpreter runs (default: 5)")
+    parser.add_argument('--top', type=int, default=20, help="Packages to list (default: 20)")
+    parser.add_argument('--hook', type=Path, default=HOOK_PATH, help="Hook script to measure")
+    args = parser.parse_args()
+
+    print("\nHOOK IMPORT TIME - COLD INTERPRETER")
+    print(f"Hook: {args.hook}")
+    print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+    results = measure_hook_import_time(args.hook, runs=args.runs)
+
+    print("=" * 80)
+    print(f"{'PACKAGE':<40} {'SELF (ms, avg)':>16} {'SHARE':>8}")
+    print("=" * 80)
+    total_us = sum(results['packages_us'].values()) or 1
+    for package, self_us in list(results['packages_us'].items())[:args.top]:
+        print(f"{package:<40} {self_us / 1000:>16.2f} {self_us / total_us:>7.1%}")
+
+    print(f"\nResults ({results['runs']} runs):")
+    print(f"  Hook load (median): {results['median_load_ms']:6.1f}ms")
+    print(f"  Hook load (min):    {results['min_load_ms']:6.1f}ms")
+    print(f"  Hook load (max):    {results['max_load_ms']:6.1f}ms")
+    print(f"  Imports (median):   {results['median_import_ms']:6.1f}ms (under -X importtime)")
+    print(f"  Instrumented load:  {results['median_instrumented_load_ms']:6.1f}ms (not used for budgets)")
+
+    results_file = project_root / 'tests' / 'hook_import_time_results.json'
+    results['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    with open(results_file, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\nDetailed results saved to: {results_file}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for benchmark_prompt_replay.py helpers
+
+Covers corpus loading/redaction, percentile math and baseline comparison.
+The hook itself is not needed for these tests.
+
+Run with: pytest tests/test_benchmark_prompt_replay.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import benchmark_prompt_replay as replay
+
+
+def _results(in_process_p50=1.0, subprocess_p50=None):
+    """Minimal results dict with the shape main() produces"""
+    stats = {'p50_ms': in_process_p50, 'p95_ms': in_process_p50, 'p99_ms': in_process_p50}
+    results = {'in_process': {'cold': dict(stats), 'warm': dict(stats)}}
+    if subprocess_p50 is not None:
+        results['subprocess'] = {
+            'cold_first_run_ms': subprocess_p50,
+            'warm': {'p50_ms': subprocess_p50, 'p95_ms': subprocess_p50, 'p99_ms': subprocess_p50},
+        }
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEST: Percentile
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_percentile_nearest_rank():
+    """Nearest-rank uses ceil, not round-half-even"""
+    assert replay.percentile(list(range(1, 50)), 50) == 25
+    assert replay.percentile(list(range(1, 101)), 95) == 95
+    assert replay.percentile(list(range(1, 101)), 99) == 99
+
+
+def test_percentile_edges():
+    """Single value and 100th percentile"""
+    assert replay.percentile([7.0], 50) == 7.0
+    assert replay.percentile([3, 1, 2], 100) == 3
+    assert replay.percentile([3, 1, 2], 0) == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEST: Corpus Loading & Redaction
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_redact():
+    """Emails, home directories, tokens and long hex ids are stripped"""
+    prompt = "mail bob@example.com about /home/bob/app, key ghp_abcdefghijkl1234, id " + "a" * 40
+    redacted = replay.redact(prompt)
+
+    assert redacted == "mail <email> about /home/<user>/app, key <token>, id <hex>"
+
+
+def test_load_corpus_file_skips_invalid_prompts(tmp_path):
+    """null, missing and non-string prompts are skipped, not crashed on"""
+    corpus_file = tmp_path / 'prompts.jsonl'
+    corpus_file.write_text('\n'.join([
+        json.dumps({'prompt': None}),
+        json.dumps({'other': 'field'}),
+        json.dumps({'prompt': 123}),
+        json.dumps({'prompt': ''}),
+        json.dumps({'prompt': 'research caching'}),
+    ]) + '\n')
+
+    assert replay.load_corpus_file(corpus_file) == ['research caching']
+
+
+def test_load_corpus_file_user_prompt_fallback(tmp_path):
+    """user_prompt is used when prompt is absent or null"""
+    corpus_file = tmp_path / 'prompts.jsonl'
+    corpus_file.write_text('\n'.join([
+        json.dumps({'prompt': None, 'user_prompt': 'build a CLI tool'}),
+        json.dumps({'user_prompt': 'find the auth logic'}),
+    ]) + '\n')
+
+    assert replay.load_corpus_file(corpus_file) == ['build a CLI tool', 'find the auth logic']
+
+
+def test_load_corpus_file_plain_text_lines(tmp_path):
+    """Non-JSON and non-object lines are prompts as-is (redacted)"""
+    corpus_file = tmp_path / 'prompts.txt'
+    corpus_file.write_text("continue\n\n[1, 2]\nping alice@example.org\n")
+
+    assert replay.load_corpus_file(corpus_file) == ['continue', '[1, 2]', 'ping <email>']
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEST: Corpus Identity
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_corpus_identity_stable():
+    """Same corpus and options give the same identity"""
+    corpus = replay.build_synthetic_corpus(20, seed=1)
+    again = replay.build_synthetic_corpus(20, seed=1)
+
+    assert replay.corpus_identity(20, 1, corpus, []) == replay.corpus_identity(20, 1, again, [])
+
+
+def test_corpus_identity_detects_changes():
+    """Different seed, file list or prompt content changes the identity"""
+    corpus = replay.build_synthetic_corpus(20, seed=1)
+    identity = replay.corpus_identity(20, 1, corpus, [])
+
+    assert replay.corpus_identity(20, 2, replay.build_synthetic_corpus(20, seed=2), []) != identity
+    assert replay.corpus_identity(20, 1, corpus, [Path('/tmp/extra.jsonl')])['files'] == ['extra.jsonl']
+    assert replay.corpus_identity(20, 1, corpus[:-1] + ['changed'], [])['sha256'] != identity['sha256']
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEST: Baseline Comparison
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_compare_to_baseline_flags_regression():
+    """Slower by more than tolerance and min delta is a regression"""
+    regressions = replay.compare_to_baseline(
+        _results(in_process_p50=5.0), _results(in_process_p50=2.0), tolerance=0.25, min_delta_ms=0.5
+    )
+
+    metrics = {metric for metric, _, _ in regressions}
+    assert 'in_process.warm.p50_ms' in metrics
+    assert 'in_process.cold.p95_ms' in metrics
+
+
+def test_compare_to_baseline_ignores_jitter_below_min_delta():
+    """Microsecond jitter is not a regression even at +100%"""
+    regressions = replay.compare_to_baseline(
+        _results(in_process_p50=0.002), _results(in_process_p50=0.001), tolerance=0.25, min_delta_ms=0.5
+    )
+
+    assert regressions == []
+
+
+def test_compare_to_baseline_within_tolerance():
+    """Slower by more than min delta but within tolerance passes"""
+    regressions = replay.compare_to_baseline(
+        _results(in_process_p50=11.0), _results(in_process_p50=10.0), tolerance=0.25, min_delta_ms=0.5
+    )
+
+    assert regressions == []
+
+
+def test_uncompared_metrics_reports_missing_subprocess():
+    """Baseline subprocess metrics missing from the run are reported"""
+    missing = replay.uncompared_metrics(
+        _results(), _results(subprocess_p50=30.0)
+    )
+
+    assert missing == [
+        'subprocess.warm.p50_ms', 'subprocess.warm.p95_ms', 'subprocess.warm.p99_ms'
+    ]
+    assert replay.uncompared_metrics(_results(subprocess_p50=30.0), _results()) == []